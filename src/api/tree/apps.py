@@ -1,6 +1,31 @@
+import atexit
+import logging
+
+import structlog
 from django.apps import AppConfig
+from django.conf import settings
+
+from theary.log_stream import BufferedLogStream
 
 
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.tree"
+
+    def ready(self):
+        """
+        Start the background parts of log output.
+
+        The listener writing out the records queued by LOGGING is started,
+        and outside debug mode structlog events are batched through a
+        BufferedLogStream that is also flushed on SIGTERM.
+        """
+        handler = logging.getHandlerByName("default")
+        if handler is not None and handler.listener is not None:
+            handler.listener.start()
+            atexit.register(handler.listener.stop)
+
+        if not settings.DEBUG:
+            log_stream = BufferedLogStream()
+            log_stream.flush_on_sigterm()
+            structlog.configure(logger_factory=structlog.BytesLoggerFactory(log_stream))
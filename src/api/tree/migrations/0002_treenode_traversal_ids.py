@@ -0,0 +1,72 @@
+# Generated by Django 5.2.1 on 2026-10-15 04:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# Fill traversal_ids for rows created before the column existed
+BACKFILL_TRAVERSAL_IDS = """
+WITH RECURSIVE paths AS (
+    SELECT id, ARRAY[id] AS traversal_ids FROM tree_node WHERE parent_id IS NULL
+    UNION ALL
+    SELECT child.id, paths.traversal_ids || child.id
+    FROM tree_node child JOIN paths ON child.parent_id = paths.id
+)
+UPDATE tree_node SET traversal_ids = paths.traversal_ids
+FROM paths WHERE tree_node.id = paths.id;
+"""
+
+# Derive traversal_ids from the parent row on every insert and re-parenting,
+# so bulk and raw SQL inserts keep the column correct as well. This only sets
+# the path of the written row; the descendants of a moved node are rewritten
+# by the trigger added in 0006.
+CREATE_TRAVERSAL_IDS_TRIGGER = """
+CREATE FUNCTION tree_node_set_traversal_ids() RETURNS trigger AS $$
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.traversal_ids := ARRAY[NEW.id];
+    ELSE
+        SELECT traversal_ids || NEW.id INTO NEW.traversal_ids
+        FROM tree_node WHERE id = NEW.parent_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tree_node_traversal_ids
+BEFORE INSERT OR UPDATE OF parent_id ON tree_node
+FOR EACH ROW EXECUTE FUNCTION tree_node_set_traversal_ids();
+"""
+
+DROP_TRAVERSAL_IDS_TRIGGER = """
+DROP TRIGGER tree_node_traversal_ids ON tree_node;
+DROP FUNCTION tree_node_set_traversal_ids();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tree", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="treenode",
+            name="traversal_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                default=list,
+                editable=False,
+                help_text="IDs from the root down to this node, maintained by a database trigger",
+                size=None,
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_TRAVERSAL_IDS, migrations.RunSQL.noop),
+        migrations.RunSQL(CREATE_TRAVERSAL_IDS_TRIGGER, DROP_TRAVERSAL_IDS_TRIGGER),
+        migrations.AddIndex(
+            model_name="treenode",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["traversal_ids"], name="tree_node_traversal_ids_idx"
+            ),
+        ),
+    ]
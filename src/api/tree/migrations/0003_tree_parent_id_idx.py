@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2026-10-15 04:06
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("tree", "0002_treenode_traversal_ids"),
+    ]
+
+    # Build the covering index before dropping the single-column FK index it
+    # replaces, so parent lookups are never left without an index
+    operations = [
+        AddIndexConcurrently(
+            model_name="treenode",
+            index=models.Index(
+                fields=["parent", "id"],
+                include=("label",),
+                name="tree_parent_id_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="treenode",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                help_text="Parent node reference (null for root nodes)",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="children",
+                to="tree.treenode",
+            ),
+        ),
+    ]
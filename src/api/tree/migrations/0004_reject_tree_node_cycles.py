@@ -0,0 +1,50 @@
+# Generated by Django 5.2.1 on 2026-10-15 04:20
+
+from django.db import migrations
+
+# Refuse to attach a node below itself: its ID is part of the path of every
+# one of its descendants, so a cycle would show up in the new parent's path
+REJECT_CYCLES = """
+CREATE OR REPLACE FUNCTION tree_node_set_traversal_ids() RETURNS trigger AS $$
+DECLARE
+    parent_path integer[];
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.traversal_ids := ARRAY[NEW.id];
+    ELSE
+        SELECT traversal_ids INTO parent_path
+        FROM tree_node WHERE id = NEW.parent_id;
+        IF NEW.id = ANY(parent_path) THEN
+            RAISE EXCEPTION 'tree_node % cannot be moved below itself', NEW.id
+                USING ERRCODE = 'check_violation';
+        END IF;
+        NEW.traversal_ids := parent_path || NEW.id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ALLOW_CYCLES = """
+CREATE OR REPLACE FUNCTION tree_node_set_traversal_ids() RETURNS trigger AS $$
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.traversal_ids := ARRAY[NEW.id];
+    ELSE
+        SELECT traversal_ids || NEW.id INTO NEW.traversal_ids
+        FROM tree_node WHERE id = NEW.parent_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tree", "0003_tree_parent_id_idx"),
+    ]
+
+    operations = [
+        migrations.RunSQL(REJECT_CYCLES, ALLOW_CYCLES),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.1 on 2026-10-15 05:10
+
+from django.db import migrations
+
+# The foreign key is only checked at commit, as Django creates it deferrable;
+# failing in the trigger instead reports a missing parent on the INSERT itself,
+# where the statement's savepoint can still be rolled back
+REJECT_MISSING_PARENT = """
+CREATE OR REPLACE FUNCTION tree_node_set_traversal_ids() RETURNS trigger AS $$
+DECLARE
+    parent_path integer[];
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.traversal_ids := ARRAY[NEW.id];
+    ELSE
+        SELECT traversal_ids INTO parent_path
+        FROM tree_node WHERE id = NEW.parent_id;
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'tree_node % does not exist', NEW.parent_id
+                USING ERRCODE = 'foreign_key_violation';
+        END IF;
+        IF NEW.id = ANY(parent_path) THEN
+            RAISE EXCEPTION 'tree_node % cannot be moved below itself', NEW.id
+                USING ERRCODE = 'check_violation';
+        END IF;
+        NEW.traversal_ids := parent_path || NEW.id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ALLOW_MISSING_PARENT = """
+CREATE OR REPLACE FUNCTION tree_node_set_traversal_ids() RETURNS trigger AS $$
+DECLARE
+    parent_path integer[];
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.traversal_ids := ARRAY[NEW.id];
+    ELSE
+        SELECT traversal_ids INTO parent_path
+        FROM tree_node WHERE id = NEW.parent_id;
+        IF NEW.id = ANY(parent_path) THEN
+            RAISE EXCEPTION 'tree_node % cannot be moved below itself', NEW.id
+                USING ERRCODE = 'check_violation';
+        END IF;
+        NEW.traversal_ids := parent_path || NEW.id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tree", "0004_reject_tree_node_cycles"),
+    ]
+
+    operations = [
+        migrations.RunSQL(REJECT_MISSING_PARENT, ALLOW_MISSING_PARENT),
+    ]
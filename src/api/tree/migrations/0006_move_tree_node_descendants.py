@@ -0,0 +1,42 @@
+# Generated by Django 5.2.1 on 2026-10-15 05:40
+
+from django.db import migrations
+
+# Re-parenting a node only recomputes its own path in the BEFORE trigger; the
+# path of every descendant starts with the moved node's old path, so replace
+# that prefix with the new one. Only traversal_ids is written, which does not
+# fire either trigger again.
+CREATE_MOVE_DESCENDANTS_TRIGGER = """
+CREATE FUNCTION tree_node_move_descendants() RETURNS trigger AS $$
+BEGIN
+    IF NEW.traversal_ids IS DISTINCT FROM OLD.traversal_ids THEN
+        UPDATE tree_node
+        SET traversal_ids = NEW.traversal_ids
+            || traversal_ids[cardinality(OLD.traversal_ids) + 1:]
+        WHERE traversal_ids @> ARRAY[OLD.id] AND id <> OLD.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tree_node_move_descendants
+AFTER UPDATE OF parent_id ON tree_node
+FOR EACH ROW EXECUTE FUNCTION tree_node_move_descendants();
+"""
+
+DROP_MOVE_DESCENDANTS_TRIGGER = """
+DROP TRIGGER tree_node_move_descendants ON tree_node;
+DROP FUNCTION tree_node_move_descendants();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tree", "0005_reject_missing_tree_node_parent"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            CREATE_MOVE_DESCENDANTS_TRIGGER, DROP_MOVE_DESCENDANTS_TRIGGER
+        ),
+    ]
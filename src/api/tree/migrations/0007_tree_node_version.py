@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-15 07:20
+
+from django.db import migrations
+
+# A single-row counter that every statement writing to tree_node increments,
+# including bulk, QuerySet.update() and raw SQL writes, so readers can tell
+# whether the forest changed by reading one row. Each committed write raises
+# the committed value, so a version number never stands for two different
+# committed forests.
+CREATE_VERSION_TABLE = """
+CREATE TABLE tree_node_version (
+    id boolean PRIMARY KEY DEFAULT true CHECK (id),
+    version bigint NOT NULL
+);
+INSERT INTO tree_node_version (version) VALUES (0);
+
+CREATE FUNCTION tree_node_bump_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE tree_node_version SET version = version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tree_node_bump_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON tree_node
+FOR EACH STATEMENT EXECUTE FUNCTION tree_node_bump_version();
+"""
+
+DROP_VERSION_TABLE = """
+DROP TRIGGER tree_node_bump_version ON tree_node;
+DROP FUNCTION tree_node_bump_version();
+DROP TABLE tree_node_version;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tree", "0006_move_tree_node_descendants"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_VERSION_TABLE, DROP_VERSION_TABLE),
+    ]
@@ -8,19 +8,61 @@ Models:
     TreeNode: Represents a node in a hierarchical tree structure
 """
 
-from collections import deque
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from typing import Self
 
+import orjson
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connection
 from django.db.models import (
     Model,
     AutoField,
     CharField,
     ForeignKey,
     DateTimeField,
+    IntegerField,
     CASCADE,
+    Index,
     QuerySet,
 )
 
+# Copies a subtree in one statement. New IDs are drawn in source ID order, so
+# clones keep the sibling order of the originals, and the CTE is materialized
+# so each row keeps its ID when joined to its parent. Rows are inserted
+# parents first and the inserted root is returned.
+_CLONE_SUBTREE_SQL = """
+WITH source AS MATERIALIZED (
+    SELECT
+        node.*,
+        nextval(pg_get_serial_sequence('tree_node', 'id')) AS new_id
+    FROM (
+        SELECT id, label, parent_id, cardinality(traversal_ids) AS depth
+        FROM tree_node
+        WHERE traversal_ids @> ARRAY[%(source_id)s]
+        ORDER BY id
+    ) node
+),
+inserted AS (
+    INSERT INTO tree_node (id, label, parent_id, created_at, traversal_ids)
+    SELECT
+        node.new_id,
+        node.label,
+        CASE WHEN node.id = %(source_id)s THEN %(parent_id)s ELSE parent.new_id END,
+        now(),
+        '{}'
+    FROM source node
+    LEFT JOIN source parent ON parent.id = node.parent_id
+    ORDER BY node.depth
+    RETURNING *
+)
+SELECT inserted.*
+FROM inserted
+JOIN source ON source.new_id = inserted.id
+WHERE source.id = %(source_id)s
+"""
+
 
 class TreeNode(Model):
     """
@@ -34,6 +76,7 @@ class TreeNode(Model):
         label (CharField): Human-readable label for the node (max 255 chars)
         parent (ForeignKey): Optional reference to parent node (null for roots)
         created_at (DateTimeField): Timestamp when the node was created
+        traversal_ids (ArrayField): IDs on the path from the root to this node
 
     Relationships:
         children: Reverse foreign key to child nodes (related_name)
@@ -42,7 +85,8 @@ class TreeNode(Model):
         - Self-referential foreign key for parent-child relationships
         - Cascade deletion: deleting a parent removes all descendants
         - Automatic timestamp tracking for creation time
-        - Built-in serialization method for API responses
+        - Denormalized root-to-node path (traversal_ids) for indexed subtree reads
+        - Cached JSON encoding of the whole forest for API responses
     """
 
     id: AutoField = AutoField(primary_key=True)
@@ -55,86 +99,169 @@ class TreeNode(Model):
         null=True,
         blank=True,
         related_name="children",
+        db_index=False,  # Served by the composite tree_parent_id_idx
         help_text="Parent node reference (null for root nodes)",
     )
     created_at: DateTimeField = DateTimeField(
         auto_now_add=True, help_text="Timestamp when the node was created"
     )
+    traversal_ids: ArrayField = ArrayField(
+        IntegerField(),
+        default=list,
+        editable=False,
+        help_text="IDs from the root down to this node, maintained by a database trigger",
+    )
     children: QuerySet["TreeNode"]
 
-    def to_dict_with_children(self) -> dict:
+    @staticmethod
+    def _json_chunks(
+        root_ids: Iterable[int],
+        labels: dict[int, str],
+        children_of: dict[int, list[int]],
+    ) -> Iterator[bytes]:
         """
-        Recursively serialize tree node to dictionary including all descendants.
+        Encode trees from flat adjacency maps as comma-separated JSON objects.
 
-        This method performs a depth-first traversal of the tree structure,
-        building a nested dictionary representation suitable for JSON serialization.
+        The walk is an iterative pre-order traversal that keeps only the
+        current path on the stack, and orjson encodes scalars only, so the
+        nested structure is never built and neither Python's recursion limit
+        nor orjson's nesting limit bounds the depth of a tree.
 
-        Returns:
-            dict: Nested dictionary with structure:
-                {
-                    "id": int,
-                    "label": str,
-                    "children": [dict, ...]  # Recursively nested children
-                }
-
-        Note:
-            This method triggers database queries for each level of children.
-            For large trees, consider using select_related/prefetch_related
-            in the original query for better performance.
+        Args:
+            root_ids (Iterable): IDs of the tree roots, in output order
+            labels (dict): Labels by node ID
+            children_of (dict): Child IDs, in output order, by parent ID
+
+        Yields:
+            bytes: Consecutive fragments of the encoded trees
         """
-        return {
-            "id": self.id,
-            "label": self.label,
-            "children": [
-                child.to_dict_with_children() for child in self.children.all()
-            ],
-        }
+        # One frame per open node: its remaining children and whether a
+        # sibling has already been written (so the next one needs a comma)
+        stack: list[list] = [[iter(root_ids), False]]
+        while stack:
+            frame = stack[-1]
+            node_id = next(frame[0], None)
+            if node_id is None:
+                stack.pop()
+                if stack:
+                    yield b"]}"
+                continue
 
-    def clone_subtree(self, parent: Self) -> "TreeNode":
+            head = b'{"id":%b,"label":%b,"children":[' % (
+                orjson.dumps(node_id),
+                orjson.dumps(labels[node_id]),
+            )
+            if frame[1]:
+                head = b"," + head
+            frame[1] = True
+
+            child_ids = children_of.get(node_id)
+            if child_ids:
+                yield head
+                stack.append([iter(child_ids), False])
+            else:
+                yield head + b"]}"
+
+    @classmethod
+    def cached_forest_json(cls) -> bytes:
         """
-        Clone this node and all its descendants using iterative breadth-first traversal.
+        Serialize every tree to JSON, reusing the previous result while unchanged.
 
-        This method uses a bfs approach to clone the entire subtree,
-        which prevents infinite recursion and stack overflow issues while also
-        detecting circular references in the tree structure.
+        The last encoded forest is kept per process together with its
+        version, so a cache hit costs reading the one-row version counter
+        instead of fetching and encoding every node. On a miss the document
+        is only stored if the version is still the same after the rows were
+        read, so a write committed in between is never cached under the old
+        version; that document is returned but rebuilt on the next read.
 
-        Args:
-            parent (TreeNode): Parent node to attach the cloned subtree to
+        Returns:
+            bytes: UTF-8 encoded JSON array with one nested {"id", "label",
+                "children"} object per root node, roots and children in ID order
+        """
+        version = cls._forest_version()
+        cached = _cached_forest_json.get(version)
+        if cached is not None:
+            return cached
+
+        labels, children_of = cls._forest_adjacency()
+        encoded = bytearray(b"[")
+        for chunk in cls._json_chunks(children_of.pop(None, ()), labels, children_of):
+            encoded += chunk
+        encoded += b"]"
+
+        forest_json = bytes(encoded)
+        if cls._forest_version() == version:
+            _cached_forest_json.clear()
+            _cached_forest_json[version] = forest_json
+        return forest_json
+
+    @classmethod
+    def clear_forest_cache(cls) -> None:
+        """Drop the cached forest so the next cached_forest_json() rebuilds it"""
+        _cached_forest_json.clear()
+
+    @classmethod
+    def _forest_adjacency(
+        cls,
+    ) -> tuple[dict[int, str], defaultdict[int | None, list[int]]]:
+        """
+        Load every node into flat label and children maps with a single query.
+
+        This is the only read behind GET: the whole forest comes from one
+        scan of the table, so there is no per-subtree query whose planning
+        would be worth caching in a database function.
 
         Returns:
-            TreeNode: The newly created root node of the cloned subtree
+            tuple: Labels by node ID (in ID order), and child IDs (ordered
+                by ID) by parent ID, with root IDs under None
+        """
+        labels: dict[int, str] = {}
+        children_of: defaultdict[int | None, list[int]] = defaultdict(list)
+        for node_id, label, parent_id in cls.objects.values_list(
+            "id", "label", "parent_id"
+        ):
+            labels[node_id] = label
+            children_of[parent_id].append(node_id)
 
-        Raises:
-            ValueError: If circular reference is detected in the tree structure
+        return labels, children_of
+
+    @classmethod
+    def _forest_version(cls) -> int:
         """
-        # Create the cloned root node
-        cloned_root = TreeNode.objects.create(label=self.label, parent=parent)
+        Read the version of the whole forest.
 
-        # Queue stores tuples of (original_node, cloned_parent)
-        queue: deque[tuple[TreeNode, TreeNode]] = deque([(self, cloned_root)])
-        visited = {self.id, cloned_root.id}  # Track visited nodes to detect cycles
+        A statement-level trigger increments the counter in the one-row
+        tree_node_version table on every write to tree_node, whether it
+        comes from Model.save(), QuerySet.update() or raw SQL.
 
-        while queue:
-            original_node, cloned_parent = queue.popleft()
+        Returns:
+            int: Forest version
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT version FROM tree_node_version")
+            return cursor.fetchone()[0]
 
-            # Process all children of the current original node
-            for child in original_node.children.all():
-                # Detect circular reference
-                if child.id in visited:
-                    # it skips the circulare references
-                    continue
+    def clone_subtree(self, parent: Self) -> "TreeNode":
+        """
+        Clone this node and all its descendants under a new parent.
 
-                # Clone the child
-                cloned_child = TreeNode.objects.create(
-                    label=child.label, parent=cloned_parent
-                )
+        The whole clone is a single INSERT ... SELECT statement executed in
+        the database: the source rows are read together with freshly drawn
+        IDs for their clones, so each clone's parent ID is known up front,
+        and are inserted in depth order so that the traversal_ids trigger
+        always finds the parent row already written. The source subtree is
+        read before anything is inserted, so cloning a node under one of its
+        own descendants copies the original subtree exactly once.
 
-                # Add child to queue for further processing and mark as visited
-                queue.append((child, cloned_child))
-                visited.add(child.id)
-                visited.add(cloned_child.id)
+        Args:
+            parent (TreeNode): Parent node to attach the cloned subtree to
 
-        return cloned_root
+        Returns:
+            TreeNode: The newly created root node of the cloned subtree
+        """
+        return TreeNode.objects.raw(
+            _CLONE_SUBTREE_SQL, {"source_id": self.id, "parent_id": parent.id}
+        )[0]
 
     def __str__(self) -> str:
         """
@@ -151,9 +278,21 @@ class TreeNode(Model):
 
         Attributes:
             ordering: Default ordering by ID for consistent query results
+            indexes: GIN index serving traversal_ids containment lookups and a
+                (parent_id, id) index covering label for children lookups
         """
 
         ordering = ["id"]
+        indexes = [
+            GinIndex(fields=["traversal_ids"], name="tree_node_traversal_ids_idx"),
+            Index(
+                fields=["parent", "id"], name="tree_parent_id_idx", include=["label"]
+            ),
+        ]
         verbose_name = "Tree Node"
         verbose_name_plural = "Tree Nodes"
         db_table = "tree_node"
+
+
+# Last encoded forest by version; holds a single entry, see cached_forest_json()
+_cached_forest_json: dict[int, bytes] = {}
@@ -11,8 +11,18 @@ Classes:
     ErrorResponse: Standardized error response format
 """
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PositiveInt,
+    StringConstraints,
+)
+from typing import Annotated, Any, Dict, List, Optional, Union
+
+# tree_node.id is a Postgres integer column; larger IDs can never exist and
+# would be rejected by the database instead of failing validation
+MAX_NODE_ID = 2**31 - 1
 
 
 class TreeNodeCreateRequest(BaseModel):
@@ -24,63 +34,33 @@ class TreeNodeCreateRequest(BaseModel):
 
     Attributes:
         label: Node label (1-255 characters, automatically trimmed)
-        parentId: Optional parent node ID (must be positive integer)
+        parentId: Optional parent node ID (positive integer up to MAX_NODE_ID)
 
     Validation Rules:
-        - Label cannot be empty or whitespace-only
         - Label is automatically trimmed of leading/trailing whitespace
+        - Label cannot be empty after trimming
         - Parent ID must be positive integer if provided
+        - Parent ID cannot exceed MAX_NODE_ID
+
+    Configuration:
+        frozen: Requests are immutable once validated
     """
 
-    label: str = Field(
+    model_config = ConfigDict(frozen=True)
+
+    label: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=255),
+    ] = Field(
         ...,
-        min_length=1,
-        max_length=255,
         description="Human-readable label for the tree node (1-255 characters)",
     )
-    parentId: Optional[int] = Field(
+    parentId: Optional[PositiveInt] = Field(
         None,
+        le=MAX_NODE_ID,
         description="ID of the parent node (null for root nodes, must be positive)",
     )
 
-    @field_validator("label")
-    @classmethod
-    def validate_label(cls, v: str) -> str:
-        """
-        Validate and normalize label field.
-
-        Args:
-            v: Raw label value from request
-
-        Returns:
-            str: Trimmed label string
-
-        Raises:
-            ValueError: If label is empty or whitespace-only after trimming
-        """
-        if not v or not v.strip():
-            raise ValueError("Label cannot be empty or whitespace only")
-        return v.strip()
-
-    @field_validator("parentId")
-    @classmethod
-    def validate_parent_id(cls, v: Optional[int]) -> Optional[int]:
-        """
-        Validate parent ID field.
-
-        Args:
-            v: Parent ID value from request
-
-        Returns:
-            Optional[int]: Validated parent ID or None
-
-        Raises:
-            ValueError: If parent ID is not a positive integer
-        """
-        if v is not None and v <= 0:
-            raise ValueError("Parent ID must be a positive integer")
-        return v
-
 
 class TreeNodeResponse(BaseModel):
     """
@@ -95,32 +75,14 @@ class TreeNodeResponse(BaseModel):
 
     Configuration:
         from_attributes: Enables creation from Django model instances
+        frozen: Responses are immutable once built
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    id: int = Field(..., description="Unique identifier of the tree node")
+    id: PositiveInt = Field(..., description="Unique identifier of the tree node")
     label: str = Field(..., description="Human-readable label of the tree node")
-    parentId: Optional[int] = Field(None, description="ID of the parent node")
-
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: int) -> int:
-        """
-        Validate node ID field.
-
-        Args:
-            v: Node ID value
-
-        Returns:
-            int: Validated node ID
-
-        Raises:
-            ValueError: If ID is not positive
-        """
-        if v <= 0:
-            raise ValueError("ID must be a positive integer")
-        return v
+    parentId: Optional[PositiveInt] = Field(None, description="ID of the parent node")
 
 
 class TreeNodeWithChildren(BaseModel):
@@ -137,48 +99,35 @@ class TreeNodeWithChildren(BaseModel):
 
     Configuration:
         from_attributes: Enables creation from Django model instances
+        frozen: Responses are immutable once built
 
     Note:
         This model uses forward references for recursive typing.
         model_rebuild() is called after class definition to resolve references.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    id: int = Field(..., description="Unique identifier of the tree node")
+    id: PositiveInt = Field(..., description="Unique identifier of the tree node")
     label: str = Field(..., description="Human-readable label of the tree node")
     children: List["TreeNodeWithChildren"] = Field(
-        default=[], description="List of child nodes (empty list for leaf nodes)"
+        default_factory=list,
+        description="List of child nodes (empty list for leaf nodes)",
     )
 
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: int) -> int:
-        """
-        Validate node ID field.
-
-        Args:
-            v: Node ID value
-
-        Returns:
-            int: Validated node ID
-
-        Raises:
-            ValueError: If ID is not positive
-        """
-        if v <= 0:
-            raise ValueError("ID must be a positive integer")
-        return v
-
 
 # Resolve forward reference for recursive children typing
 TreeNodeWithChildren.model_rebuild()
 
 
 class TreeNodeCloneRequest(BaseModel):
-    parent_id: int = Field(..., description="Unique identifier of parent node")
+    parent_id: int = Field(
+        ..., le=MAX_NODE_ID, description="Unique identifier of parent node"
+    )
     target_id: int = Field(
-        ..., description="Unique identifier of targeted node to clone"
+        ...,
+        le=MAX_NODE_ID,
+        description="Unique identifier of targeted node to clone",
     )
 
 
@@ -191,16 +140,22 @@ class ErrorResponse(BaseModel):
 
     Attributes:
         error: Main error message describing what went wrong
-        details: Optional additional context or validation details
+        details: Optional additional context, or the list of validation
+            errors (type, loc, msg, ctx) when the request failed validation
 
     Usage:
         Used for all API error responses (4xx and 5xx status codes)
         to ensure consistent error format for client applications.
+
+    Configuration:
+        frozen: Responses are immutable once built
     """
 
+    model_config = ConfigDict(frozen=True)
+
     error: str = Field(
         ..., description="Primary error message describing what went wrong"
     )
-    details: Optional[str] = Field(
-        None, description="Additional error details, context, or validation messages"
+    details: Optional[Union[str, List[Dict[str, Any]]]] = Field(
+        None, description="Additional error details, context, or validation errors"
     )
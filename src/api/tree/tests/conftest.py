@@ -0,0 +1,34 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from api.tree.models import TreeNode
+
+
+@pytest.fixture(scope="session")
+def tree_url():
+    """URL of the tree list/create endpoint"""
+    return reverse("tree-api")
+
+
+@pytest.fixture(scope="session")
+def clone_url():
+    """URL of the subtree clone endpoint"""
+    return reverse("tree-clone-api")
+
+
+@pytest.fixture(scope="class")
+def api_client():
+    """API client shared by the tests of a class"""
+    return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def cold_forest_cache():
+    """
+    Start every test with an empty forest cache.
+
+    Each test's writes are rolled back, and so are the forest version bumps
+    they made, so the next test reaches the same version numbers with
+    different rows.
+    """
+    TreeNode.clear_forest_cache()
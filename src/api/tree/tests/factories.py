@@ -0,0 +1,13 @@
+import factory
+
+from api.tree.models import TreeNode
+
+
+class TreeNodeFactory(factory.django.DjangoModelFactory):
+    """Tree nodes with sequential labels; build_batch() + bulk_create() for fan-out"""
+
+    class Meta:
+        model = TreeNode
+
+    label = factory.Sequence(lambda n: f"Node {n}")
+    parent = None
@@ -0,0 +1,11 @@
+import orjson
+
+
+def post_json(client, url, payload):
+    """Helper function to POST a payload encoded as JSON"""
+    return client.post(url, data=orjson.dumps(payload), content_type="application/json")
+
+
+def response_json(response):
+    """Helper function to decode a response body with orjson"""
+    return orjson.loads(response.content)
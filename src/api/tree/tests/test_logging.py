@@ -0,0 +1,41 @@
+import logging
+import signal
+
+from theary.log_stream import BufferedLogStream
+
+
+class TestQueuedLogging:
+    """Test cases for the queue handler configured in LOGGING"""
+
+    def test_listener_started_on_app_ready(self):
+        """Test that the listener dictConfig attached is the one running"""
+        handler = logging.getHandlerByName("default")
+
+        assert handler.listener is not None
+        assert handler.listener._thread is not None
+        assert handler.listener.queue is handler.queue
+        assert [type(h) for h in handler.listener.handlers] == [logging.StreamHandler]
+
+
+class TestBufferedLogStream:
+    """Test cases for the buffered structlog output stream"""
+
+    def test_sigterm_flushes_and_runs_previous_handler(self, capfd):
+        """Test that buffered events are written out before the previous handler runs"""
+        received = []
+        previous = signal.signal(
+            signal.SIGTERM, lambda signum, frame: received.append(signum)
+        )
+        stream = BufferedLogStream(flush_interval=60)
+        try:
+            stream.flush_on_sigterm()
+            stream.write(b"buffered event\n")
+            assert capfd.readouterr().out == ""
+
+            signal.raise_signal(signal.SIGTERM)
+
+            assert capfd.readouterr().out == "buffered event\n"
+            assert received == [signal.SIGTERM]
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            stream.close()
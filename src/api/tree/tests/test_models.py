@@ -0,0 +1,310 @@
+import sys
+
+import orjson
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models.signals import post_init
+from api.tree.models import TreeNode
+from api.tree.tests.factories import TreeNodeFactory
+
+
+@pytest.mark.django_db
+class TestTreeNodeTraversalIds:
+    """Test cases for the trigger-maintained traversal_ids column"""
+
+    def test_traversal_ids_on_create(self):
+        """Test that traversal_ids holds the root-to-node path"""
+        root = TreeNode.objects.create(label="Root")
+        child = TreeNode.objects.create(label="Child", parent=root)
+        grandchild = TreeNode.objects.create(label="Grandchild", parent=child)
+
+        grandchild.refresh_from_db()
+        assert grandchild.traversal_ids == [root.id, child.id, grandchild.id]
+
+    def test_traversal_ids_on_bulk_create(self):
+        """Test that bulk-created nodes get their path from the trigger"""
+        root = TreeNode.objects.create(label="Root")
+        TreeNode.objects.bulk_create([TreeNode(label="Child", parent=root)])
+
+        child = TreeNode.objects.get(parent=root)
+        assert child.traversal_ids == [root.id, child.id]
+
+    @pytest.mark.parametrize("new_parent", ["self", "grandchild"])
+    def test_cycle_rejected(self, new_parent):
+        """Test that a node cannot be moved below itself"""
+        root = TreeNode.objects.create(label="Root")
+        child = TreeNode.objects.create(label="Child", parent=root)
+        grandchild = TreeNode.objects.create(label="Grandchild", parent=child)
+
+        child.parent = child if new_parent == "self" else grandchild
+        with pytest.raises(IntegrityError), transaction.atomic():
+            child.save()
+
+    def test_cycle_rejected_after_move(self):
+        """Test that a cycle through a moved subtree is still detected"""
+        root = TreeNode.objects.create(label="Root")
+        child = TreeNode.objects.create(label="Child", parent=root)
+        grandchild = TreeNode.objects.create(label="Grandchild", parent=child)
+        other_root = TreeNode.objects.create(label="Other Root")
+        child.parent = other_root
+        child.save()
+
+        other_root.parent = grandchild
+        with pytest.raises(IntegrityError), transaction.atomic():
+            other_root.save()
+
+    def test_move_updates_descendant_paths(self):
+        """Test that moving a node rewrites the paths of its whole subtree"""
+        root = TreeNode.objects.create(label="Root")
+        child = TreeNode.objects.create(label="Child", parent=root)
+        grandchild = TreeNode.objects.create(label="Grandchild", parent=child)
+        other_root = TreeNode.objects.create(label="Other Root")
+
+        child.parent = other_root
+        child.save()
+
+        grandchild.refresh_from_db()
+        assert grandchild.traversal_ids == [other_root.id, child.id, grandchild.id]
+        assert not TreeNode.objects.filter(traversal_ids__contains=[root.id]).exclude(
+            id=root.id
+        )
+
+    def test_missing_parent_rejected_on_insert(self):
+        """Test that a missing parent fails the INSERT, not only the commit"""
+        with pytest.raises(IntegrityError), transaction.atomic():
+            TreeNode.objects.create(label="Orphan", parent_id=99999)
+
+        assert not TreeNode.objects.exists()
+
+
+@pytest.mark.django_db
+class TestTreeNodeCachedForestJson:
+    """Test cases for TreeNode.cached_forest_json"""
+
+    def test_encodes_every_tree(self, django_assert_num_queries):
+        """Test that all trees are encoded in ID order from one node query"""
+        root1 = TreeNode.objects.create(label="Root 1")
+        child = TreeNode.objects.create(label='Child "quoted" 🌳', parent=root1)
+        grandchild = TreeNode.objects.create(label="Grandchild", parent=child)
+        sibling = TreeNode.objects.create(label="Sibling", parent=root1)
+        root2 = TreeNode.objects.create(label="Root 2")
+
+        # Version check, nodes, and version check before caching
+        with django_assert_num_queries(3):
+            encoded = TreeNode.cached_forest_json()
+
+        assert encoded == orjson.dumps(
+            [
+                {
+                    "id": root1.id,
+                    "label": "Root 1",
+                    "children": [
+                        {
+                            "id": child.id,
+                            "label": 'Child "quoted" 🌳',
+                            "children": [
+                                {
+                                    "id": grandchild.id,
+                                    "label": "Grandchild",
+                                    "children": [],
+                                }
+                            ],
+                        },
+                        {"id": sibling.id, "label": "Sibling", "children": []},
+                    ],
+                },
+                {"id": root2.id, "label": "Root 2", "children": []},
+            ]
+        )
+
+    def test_empty_forest(self):
+        """Test that no nodes encode to an empty array"""
+        assert TreeNode.cached_forest_json() == b"[]"
+
+    def test_tree_deeper_than_recursion_limit(self):
+        """Test that nesting depth is limited by neither Python nor orjson"""
+        depth = sys.getrecursionlimit() + 100
+        parent = None
+        for i in range(depth):
+            parent = TreeNode.objects.create(label=f"Level {i}", parent=parent)
+
+        encoded = TreeNode.cached_forest_json()
+
+        assert encoded.count(b'"label":"Level ') == depth
+        assert encoded.endswith(b"[]}" + b"]}" * (depth - 1) + b"]")
+
+    def test_no_model_instances_created(self):
+        """Test that encoding reads rows without building TreeNode objects"""
+        root = TreeNode.objects.create(label="Root")
+        TreeNode.objects.create(label="Child", parent=root)
+        instances = []
+
+        def receiver(sender, instance, **kwargs):
+            instances.append(instance)
+
+        post_init.connect(receiver, sender=TreeNode)
+        try:
+            TreeNode.cached_forest_json()
+        finally:
+            post_init.disconnect(receiver, sender=TreeNode)
+
+        assert instances == []
+
+    def test_unchanged_forest_served_from_cache(self, django_assert_num_queries):
+        """Test that a repeated read costs only the version check"""
+        root = TreeNode.objects.create(label="Root")
+        TreeNode.objects.create(label="Child", parent=root)
+        encoded = TreeNode.cached_forest_json()
+
+        with django_assert_num_queries(1):
+            assert TreeNode.cached_forest_json() is encoded
+
+    def test_added_node_invalidates_cache(self):
+        """Test that a new node anywhere is visible on the next read"""
+        root = TreeNode.objects.create(label="Root")
+        TreeNode.cached_forest_json()
+
+        TreeNode.objects.create(label="Child", parent=root)
+
+        forest = orjson.loads(TreeNode.cached_forest_json())
+        assert [c["label"] for c in forest[0]["children"]] == ["Child"]
+
+    def test_relabeled_node_invalidates_cache(self):
+        """Test that a new label is visible on the next read"""
+        root = TreeNode.objects.create(label="Root")
+        TreeNode.cached_forest_json()
+
+        TreeNode.objects.filter(id=root.id).update(label="Renamed")
+
+        assert orjson.loads(TreeNode.cached_forest_json())[0]["label"] == "Renamed"
+
+    def test_moved_node_invalidates_cache(self):
+        """Test that a node moved under another parent is shown there"""
+        root1 = TreeNode.objects.create(label="Root 1")
+        root2 = TreeNode.objects.create(label="Root 2")
+        child = TreeNode.objects.create(label="Child", parent=root1)
+        TreeNode.cached_forest_json()
+
+        child.parent = root2
+        child.save()
+
+        forest = orjson.loads(TreeNode.cached_forest_json())
+        assert forest[0]["children"] == []
+        assert [c["label"] for c in forest[1]["children"]] == ["Child"]
+
+    def test_raw_sql_write_invalidates_cache(self):
+        """Test that a write bypassing the ORM is visible on the next read"""
+        TreeNode.objects.create(label="Root")
+        TreeNode.cached_forest_json()
+
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE tree_node SET label = 'Raw'")
+
+        assert orjson.loads(TreeNode.cached_forest_json())[0]["label"] == "Raw"
+
+    def test_write_during_rebuild_not_cached(self, monkeypatch):
+        """Test that a forest changed while it is read is not cached as current"""
+        TreeNode.objects.create(label="Root")
+        fetch = TreeNode._forest_adjacency
+
+        def fetch_then_write():
+            adjacency = fetch()
+            TreeNode.objects.create(label="Late")
+            return adjacency
+
+        monkeypatch.setattr(TreeNode, "_forest_adjacency", fetch_then_write)
+        assert b"Late" not in TreeNode.cached_forest_json()
+        monkeypatch.undo()
+
+        assert b"Late" in TreeNode.cached_forest_json()
+
+    def test_deleted_node_invalidates_cache(self):
+        """Test that a deleted node disappears on the next read"""
+        TreeNode.objects.create(label="Root 1")
+        root2 = TreeNode.objects.create(label="Root 2")
+        TreeNode.objects.create(label="Root 3")
+        TreeNode.cached_forest_json()
+
+        root2.delete()
+
+        assert b"Root 2" not in TreeNode.cached_forest_json()
+
+
+@pytest.mark.django_db
+class TestTreeNodeCloneSubtree:
+    """Test cases for TreeNode.clone_subtree"""
+
+    def test_clone_copies_structure_under_new_parent(self):
+        """Test that the whole subtree is copied under the new parent"""
+        source = TreeNode.objects.create(label="Source")
+        child1 = TreeNode.objects.create(label="Child 1", parent=source)
+        TreeNode.objects.create(label="Child 2", parent=source)
+        TreeNode.objects.create(label="Grandchild", parent=child1)
+        target_parent = TreeNode.objects.create(label="Target Parent")
+
+        cloned = source.clone_subtree(parent=target_parent)
+
+        assert cloned.id != source.id
+        assert cloned.parent_id == target_parent.id
+        original, clone_parent = orjson.loads(TreeNode.cached_forest_json())
+        assert clone_parent["children"][0]["id"] == cloned.id
+        copy = clone_parent["children"][0]
+        assert self._strip_ids(copy) == self._strip_ids(original)
+        assert TreeNode.objects.count() == 9
+
+    def test_clone_leaf_node(self):
+        """Test cloning a node without children"""
+        parent = TreeNode.objects.create(label="Parent")
+        leaf = TreeNode.objects.create(label="Leaf")
+
+        cloned = leaf.clone_subtree(parent=parent)
+
+        forest = orjson.loads(TreeNode.cached_forest_json())
+        assert forest[0]["children"] == [
+            {"id": cloned.id, "label": "Leaf", "children": []}
+        ]
+
+    def test_clone_under_own_descendant(self):
+        """Test that cloning a subtree into itself copies the original only once"""
+        root = TreeNode.objects.create(label="Root")
+        child = TreeNode.objects.create(label="Child", parent=root)
+
+        root.clone_subtree(parent=child)
+
+        assert TreeNode.objects.count() == 4
+
+    def test_clone_is_a_single_query(self, django_assert_num_queries):
+        """Test that cloning takes one query whatever the depth or size"""
+        source = parent = TreeNode.objects.create(label="Source")
+        for i in range(10):
+            parent = TreeNode.objects.create(label=f"Level {i}", parent=parent)
+        leaves = TreeNode.objects.bulk_create(
+            TreeNodeFactory.build_batch(20, parent=parent)
+        )
+        target_parent = TreeNode.objects.create(label="Target Parent")
+
+        with django_assert_num_queries(1):
+            cloned = source.clone_subtree(parent=target_parent)
+
+        assert cloned.label == "Source"
+        assert cloned.parent_id == target_parent.id
+        assert cloned.traversal_ids == [target_parent.id, cloned.id]
+        leaf = TreeNode.objects.exclude(parent=parent).get(label=leaves[0].label)
+        assert leaf.traversal_ids[:2] == [target_parent.id, cloned.id]
+        assert len(leaf.traversal_ids) == 13
+
+    def _strip_ids(self, node):
+        """Helper method to drop IDs from a serialized subtree"""
+        return {
+            "label": node["label"],
+            "children": [self._strip_ids(child) for child in node["children"]],
+        }
+
+
+class TestTreeNodeSystemChecks:
+    """Test that the model passes Django's system checks"""
+
+    def test_system_checks_pass(self):
+        """Test that the PostgreSQL fields and indexes have their app installed"""
+        call_command("check", fail_level="WARNING")
@@ -0,0 +1,147 @@
+import pytest
+from pydantic import TypeAdapter
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from api.tree.models import TreeNode
+from api.tree.serializers import TreeNodeWithChildren
+from api.tree.tests.helpers import response_json
+
+
+def _count_nodes(node):
+    """Helper function to count nodes in a tree structure iteratively"""
+    stack, count = [node], 0
+    while stack:
+        current = stack.pop()
+        count += 1
+        stack.extend(current.get("children", ()))
+    return count
+
+
+class TestTreeAPIGet(TestCase):
+    """Functional tests for reading a forest shared by all tests of the class"""
+
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the forest once; each test runs in a savepoint rolled back after it"""
+        cls.tree_url = reverse("tree-api")
+
+        cls.root1 = TreeNode.objects.create(label="Root 1")
+        cls.root2 = TreeNode.objects.create(label="Root 2")
+
+        # Root 1 children
+        cls.child1_1 = TreeNode.objects.create(label="Child 1.1", parent=cls.root1)
+        cls.child1_2 = TreeNode.objects.create(label="Child 1.2", parent=cls.root1)
+
+        # Root 2 children
+        cls.child2_1 = TreeNode.objects.create(label="Child 2.1", parent=cls.root2)
+
+        # Grandchildren
+        TreeNode.objects.create(label="Grandchild 1.1.1", parent=cls.child1_1)
+        TreeNode.objects.create(label="Grandchild 1.2.1", parent=cls.child1_2)
+        TreeNode.objects.create(label="Grandchild 1.2.2", parent=cls.child1_2)
+
+    def test_get_multiple_root_nodes(self):
+        """Test GET request with multiple root nodes"""
+        response = self.client.get(self.tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response_json(response)
+        assert len(data) == 2
+
+        # Roots are returned in ID order
+        assert [tree["id"] for tree in data] == [self.root1.id, self.root2.id]
+        assert data[0]["label"] == "Root 1"
+        assert data[1]["label"] == "Root 2"
+
+    def test_get_tree_with_children(self):
+        """Test GET request with nested tree structure"""
+        response = self.client.get(self.tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        root_data = response_json(response)[0]
+        assert root_data["label"] == "Root 1"
+        assert len(root_data["children"]) == 2
+
+        # Find both children
+        children = {child["label"]: child for child in root_data["children"]}
+        assert set(children) == {"Child 1.1", "Child 1.2"}
+
+        # Check grandchildren
+        child1_data = children["Child 1.1"]
+        assert len(child1_data["children"]) == 1
+        assert child1_data["children"][0]["label"] == "Grandchild 1.1.1"
+        assert child1_data["children"][0]["children"] == []
+        assert len(children["Child 1.2"]["children"]) == 2
+
+    def test_get_complex_tree_structure(self):
+        """Test GET request with complex multi-level tree"""
+        # The whole forest is read at once, however many trees and nodes it
+        # holds, between two version checks
+        with self.assertNumQueries(3):
+            response = self.client.get(self.tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response_json(response)
+        assert len(data) == 2
+
+        # Verify structure complexity
+        total_nodes = sum(_count_nodes(tree) for tree in data)
+        assert total_nodes == 8  # 2 roots + 3 children + 3 grandchildren
+
+        # An unchanged forest is served from cache after the version check
+        with self.assertNumQueries(1):
+            assert self.client.get(self.tree_url).content == response.content
+
+    def test_get_response_matches_schema(self):
+        """Test GET response validates against the documented tree schema"""
+        response = self.client.get(self.tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        forest = TypeAdapter(list[TreeNodeWithChildren]).validate_json(response.content)
+        assert forest[0].children[1].children[1].label == "Grandchild 1.2.2"
+        assert forest[1].children[0].label == "Child 2.1"
+
+
+@pytest.mark.django_db
+class TestTreeAPIGetFunctional:
+    """Functional tests for reading trees created by each test"""
+
+    def test_get_empty_tree(self, api_client, tree_url):
+        """Test GET request when no trees exist"""
+        response = api_client.get(tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response_json(response) == []
+
+    def test_get_single_root_node(self, api_client, tree_url):
+        """Test GET request with single root node"""
+        root = TreeNode.objects.create(label="Root Node")
+
+        response = api_client.get(tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response_json(response)
+        assert len(data) == 1
+        assert data[0]["id"] == root.id
+        assert data[0]["label"] == "Root Node"
+        assert data[0]["children"] == []
+
+    def test_get_tree_deeper_than_orjson_limit(self, api_client, tree_url):
+        """Test GET request with a tree nested deeper than orjson supports"""
+        parent = None
+        for i in range(200):
+            parent = TreeNode.objects.create(label=f"Level {i}", parent=parent)
+
+        response = api_client.get(tree_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        node = response_json(response)[0]
+        for i in range(199):
+            node = node["children"][0]
+        assert node["label"] == "Level 199"
+        assert node["children"] == []
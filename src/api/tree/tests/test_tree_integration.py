@@ -0,0 +1,177 @@
+from collections import defaultdict
+
+import factory
+import orjson
+import pytest
+from rest_framework import status
+from api.tree.models import TreeNode
+from api.tree.tests.factories import TreeNodeFactory
+from api.tree.tests.helpers import post_json, response_json
+
+UNICODE_LABELS = (
+    "Chinese: 中文节点",
+    "Japanese: 日本語ノード",
+    "Arabic: العقدة العربية",
+    "Emoji: 🌳🍃🌿",
+    "Mixed: Nœud spécial ñ 🚀",
+    "Symbols: @#$%^&*()[]{}|\\:;\"'<>?,./",
+)
+# Request bodies are encoded once at import rather than in every test
+UNICODE_BODIES = tuple(orjson.dumps({"label": label}) for label in UNICODE_LABELS)
+
+
+@pytest.mark.django_db
+class TestTreeAPIIntegration:
+    """Functional tests spanning several requests or endpoints"""
+
+    def test_integration_create_and_retrieve_tree(self, api_client, tree_url):
+        """Test that nodes created through the API form the expected tree"""
+        # Create root
+        root_data = {"label": "Integration Root"}
+        root_response = post_json(api_client, tree_url, root_data)
+        assert root_response.status_code == status.HTTP_201_CREATED
+        root_id = response_json(root_response)["id"]
+
+        # Create children
+        child1_data = {"label": "Child 1", "parentId": root_id}
+        child1_response = post_json(api_client, tree_url, child1_data)
+        assert child1_response.status_code == status.HTTP_201_CREATED
+        child1_id = response_json(child1_response)["id"]
+
+        child2_data = {"label": "Child 2", "parentId": root_id}
+        child2_response = post_json(api_client, tree_url, child2_data)
+        assert child2_response.status_code == status.HTTP_201_CREATED
+
+        # Create grandchild
+        grandchild_data = {"label": "Grandchild", "parentId": child1_id}
+        grandchild_response = post_json(api_client, tree_url, grandchild_data)
+        assert grandchild_response.status_code == status.HTTP_201_CREATED
+
+        # Verify the stored structure with one query; GET output is covered
+        # by the dedicated GET tests
+        children_of = defaultdict(set)
+        for label, parent_id in TreeNode.objects.values_list("label", "parent_id"):
+            children_of[parent_id].add(label)
+
+        assert children_of == {
+            None: {"Integration Root"},
+            root_id: {"Child 1", "Child 2"},
+            child1_id: {"Grandchild"},
+        }
+
+    def test_concurrent_node_creation(self, api_client, tree_url):
+        """Test creating multiple nodes in sequence"""
+        parent = TreeNode.objects.create(label="Concurrent Parent")
+
+        # Create most children directly, and the last one through the API
+        child_labels = [f"Child {i}" for i in range(5)]
+        TreeNode.objects.bulk_create(
+            TreeNodeFactory.build_batch(
+                4, parent=parent, label=factory.Iterator(child_labels[:-1])
+            )
+        )
+
+        data = {"label": child_labels[-1], "parentId": parent.id}
+        response = post_json(api_client, tree_url, data)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Verify in database
+        children = TreeNode.objects.filter(parent=parent)
+        assert children.count() == 5
+        assert response_json(response)["id"] in set(
+            children.values_list("id", flat=True)
+        )
+
+        child_labels_db = set(children.values_list("label", flat=True))
+        assert child_labels_db == set(child_labels)
+
+    def test_deep_tree_structure(self, api_client, tree_url):
+        """Test creating and retrieving deep tree structure"""
+        levels = [f"Level {i}" for i in range(10)]
+
+        # Create a deep tree (10 levels), the deepest one through the API
+        parent = None
+        for level in levels[:-1]:
+            parent = TreeNode.objects.create(label=level, parent=parent)
+
+        data = {"label": levels[-1], "parentId": parent.id}
+        response = post_json(api_client, tree_url, data)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Verify the chain in the database; GET output is covered elsewhere
+        path = TreeNode.objects.values_list("traversal_ids", flat=True).get(
+            id=response_json(response)["id"]
+        )
+        labels = TreeNode.objects.filter(id__in=path).values_list("label", flat=True)
+        assert list(labels) == levels
+
+    def test_large_tree_performance(self, api_client, tree_url):
+        """Test handling of tree with many siblings"""
+        labels = [f"Child {i:02d}" for i in range(50)]
+        root = TreeNode.objects.create(label="Large Tree Root")
+
+        # Create 49 children directly, and the last one through the API
+        TreeNode.objects.bulk_create(
+            TreeNodeFactory.build_batch(
+                49, parent=root, label=factory.Iterator(labels[:-1])
+            )
+        )
+        data = {"label": labels[-1], "parentId": root.id}
+        response = post_json(api_client, tree_url, data)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Verify all children are present; GET output is covered elsewhere
+        child_labels = set(
+            TreeNode.objects.filter(parent=root).values_list("label", flat=True)
+        )
+        assert child_labels == set(labels)
+
+    @pytest.mark.parametrize("label,body", list(zip(UNICODE_LABELS, UNICODE_BODIES)))
+    def test_unicode_and_special_characters(self, api_client, tree_url, label, body):
+        """Test handling of unicode and special characters"""
+        response = api_client.post(tree_url, body, content_type="application/json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response_json(response)["label"] == label
+
+        # Retrieve and verify
+        get_response = api_client.get(tree_url)
+        assert get_response.status_code == status.HTTP_200_OK
+        assert [tree["label"] for tree in response_json(get_response)] == [label]
+
+    def test_post_clone_subtree(self, api_client, clone_url):
+        """Test cloning a subtree under another node through the API"""
+        source = TreeNode.objects.create(label="Source")
+        TreeNode.objects.create(label="Source Child", parent=source)
+        target_parent = TreeNode.objects.create(label="Target Parent")
+
+        data = {"parent_id": target_parent.id, "target_id": source.id}
+        response = post_json(api_client, clone_url, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        cloned_id, cloned_label = TreeNode.objects.values_list("id", "label").get(
+            parent=target_parent
+        )
+        assert cloned_label == "Source"
+        assert list(
+            TreeNode.objects.filter(parent_id=cloned_id).values_list("label", flat=True)
+        ) == ["Source Child"]
+
+    def test_post_clone_missing_target_error(self, api_client, clone_url):
+        """Test cloning a non-existent node"""
+        parent = TreeNode.objects.create(label="Parent")
+
+        data = {"parent_id": parent.id, "target_id": 99999}
+        response = post_json(api_client, clone_url, data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Target node does not exist" in response_json(response)["error"]
+
+    def test_post_clone_out_of_range_target_error(self, api_client, clone_url):
+        """Test cloning a node ID beyond the range of the id column"""
+        parent = TreeNode.objects.create(label="Parent")
+
+        data = {"parent_id": parent.id, "target_id": 2**31}
+        response = post_json(api_client, clone_url, data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Validation failed" in response_json(response)["error"]
@@ -0,0 +1,163 @@
+import pytest
+from rest_framework import status
+from api.tree.models import TreeNode
+from api.tree.serializers import ErrorResponse
+from api.tree.tests.helpers import post_json, response_json
+
+
+@pytest.mark.django_db
+class TestTreeAPIPost:
+    """Functional tests for creating nodes and validating requests"""
+
+    def test_post_create_root_node(self, api_client, tree_url):
+        """Test POST request to create root node"""
+        data = {"label": "New Root"}
+
+        response = post_json(api_client, tree_url, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response["Content-Type"] == "application/json"
+        response_data = response_json(response)
+        assert response_data["label"] == "New Root"
+        assert "id" in response_data
+
+        # Verify in database
+        row = TreeNode.objects.values("label", "parent_id").get(id=response_data["id"])
+        assert row == {"label": "New Root", "parent_id": None}
+
+    def test_post_create_child_node(self, api_client, tree_url):
+        """Test POST request to create child node"""
+        parent = TreeNode.objects.create(label="Parent")
+
+        data = {"label": "Child Node", "parentId": parent.id}
+
+        response = post_json(api_client, tree_url, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = response_json(response)
+        assert "id" in response_data
+        assert response_data["label"] == "Child Node"
+
+        # Verify in database
+        row = TreeNode.objects.values("label", "parent_id").get(id=response_data["id"])
+        assert row == {"label": "Child Node", "parent_id": parent.id}
+
+    def test_post_label_trimming(self, api_client, tree_url):
+        """Test that labels are properly trimmed during creation"""
+        data = {"label": "  Trimmed Label  "}
+
+        response = post_json(api_client, tree_url, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = response_json(response)
+        assert response_data["label"] == "Trimmed Label"
+
+    def test_post_special_characters_in_label(self, api_client, tree_url):
+        """Test creating node with special characters in label"""
+        data = {"label": "Node with émojis 🌳 and symbols @#$%"}
+
+        response = post_json(api_client, tree_url, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = response_json(response)
+        assert response_data["label"] == "Node with émojis 🌳 and symbols @#$%"
+
+    def test_post_max_length_label_success(self, api_client, tree_url):
+        """Test POST request with label at maximum allowed length"""
+        data = {"label": "a" * 255}
+
+        response = post_json(api_client, tree_url, data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = response_json(response)
+        assert len(response_data["label"]) == 255
+
+    @pytest.mark.parametrize(
+        "payload,expected_error",
+        [
+            pytest.param({"parentId": 1}, "Validation failed", id="missing-label"),
+            pytest.param({"label": ""}, "Validation failed", id="empty-label"),
+            pytest.param({"label": "   "}, "Validation failed", id="whitespace-label"),
+            pytest.param({"label": "a" * 256}, "Validation failed", id="long-label"),
+            pytest.param(
+                {"label": "Child", "parentId": 99999},
+                "Parent node does not exist",
+                id="unknown-parent",
+            ),
+            pytest.param(
+                {"label": "Child", "parentId": -1},
+                "Validation failed",
+                id="negative-parent",
+            ),
+            pytest.param(
+                {"label": "Child", "parentId": 0}, "Validation failed", id="zero-parent"
+            ),
+            pytest.param(
+                {"label": "Child", "parentId": 2**31},
+                "Validation failed",
+                id="out-of-range-parent",
+            ),
+        ],
+    )
+    def test_post_validation_errors(
+        self, api_client, tree_url, payload, expected_error
+    ):
+        """Test POST requests rejected by validation or parent lookup"""
+        response = post_json(api_client, tree_url, payload)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response_data = response_json(response)
+        assert expected_error in response_data["error"]
+        assert set(response_data) == set(ErrorResponse.model_fields)
+
+    def test_post_validation_error_details(self, api_client, tree_url):
+        """Test that validation failures list structured errors"""
+        response = post_json(api_client, tree_url, {"label": "   "})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response_json(response)["details"] == [
+            {
+                "type": "string_too_short",
+                "loc": ["label"],
+                "msg": "String should have at least 1 character",
+                "ctx": {"min_length": 1},
+            }
+        ]
+
+    def test_post_invalid_json_error(self, api_client, tree_url):
+        """Test POST request with invalid JSON"""
+        response = api_client.post(
+            tree_url, data="invalid json", content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response_json(response)["error"] == "Validation failed"
+
+    def test_post_form_data(self, api_client, tree_url):
+        """Test POST request with form data instead of JSON"""
+        response = api_client.post(tree_url, data={"label": "Test"})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response_json(response)["label"] == "Test"
+
+    def test_post_unsupported_content_type(self, api_client, tree_url):
+        """Test POST request with a content type no parser accepts"""
+        response = api_client.post(
+            tree_url, data="label=Test", content_type="text/plain"
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_unsupported_http_methods(self, api_client, tree_url):
+        """Test that unsupported HTTP methods return appropriate errors"""
+        # Test PUT
+        put_response = api_client.put(tree_url, {})
+        assert put_response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+        # Test DELETE
+        delete_response = api_client.delete(tree_url)
+        assert delete_response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+        # Test PATCH
+        patch_response = api_client.patch(tree_url, {})
+        assert patch_response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
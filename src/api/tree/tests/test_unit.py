@@ -7,6 +7,16 @@ from api.tree.serializers import (
     ErrorResponse,
 )
 
+# Pure validation cases are looped over in-process rather than parametrized,
+# so each group costs one collected test instead of one per case
+TRIMMED_LABELS = (
+    ("  Trimmed Label  ", "Trimmed Label"),
+    ("\t\nTabbed Label\n\t", "Tabbed Label"),
+    ("   Single Space   ", "Single Space"),
+    ("NoSpaces", "NoSpaces"),
+)
+WHITESPACE_LABELS = ("   ", "\t\t", "\n\n", " \t\n ")
+
 
 class TestTreeNodeCreateRequest:
     """Test cases for TreeNodeCreateRequest serializer"""
@@ -25,19 +35,11 @@ class TestTreeNodeCreateRequest:
         assert request.label == "Root Node"
         assert request.parentId is None
 
-    @pytest.mark.parametrize(
-        "input_label,expected_label",
-        [
-            ("  Trimmed Label  ", "Trimmed Label"),
-            ("\t\nTabbed Label\n\t", "Tabbed Label"),
-            ("   Single Space   ", "Single Space"),
-            ("NoSpaces", "NoSpaces"),
-        ],
-    )
-    def test_label_trimming(self, input_label, expected_label):
+    def test_label_trimming(self):
         """Test that labels are properly trimmed of various whitespace"""
-        request = TreeNodeCreateRequest(label=input_label)
-        assert request.label == expected_label
+        for input_label, expected_label in TRIMMED_LABELS:
+            request = TreeNodeCreateRequest(label=input_label)
+            assert request.label == expected_label, input_label
 
     def test_missing_label_raises_error(self):
         """Test that missing label raises validation error"""
@@ -53,20 +55,12 @@ class TestTreeNodeCreateRequest:
             TreeNodeCreateRequest(label="")
         assert "String should have at least 1 character" in str(exc_info.value)
 
-    @pytest.mark.parametrize(
-        "whitespace_label",
-        [
-            "   ",
-            "\t\t",
-            "\n\n",
-            " \t\n ",
-        ],
-    )
-    def test_whitespace_only_label_raises_error(self, whitespace_label):
+    def test_whitespace_only_label_raises_error(self):
         """Test that whitespace-only labels raise validation error"""
-        with pytest.raises(ValidationError) as exc_info:
-            TreeNodeCreateRequest(label=whitespace_label)
-        assert "Label cannot be empty or whitespace only" in str(exc_info.value)
+        for whitespace_label in WHITESPACE_LABELS:
+            with pytest.raises(ValidationError, match="at least 1 character"):
+                TreeNodeCreateRequest(label=whitespace_label)
+                pytest.fail(f"Label {whitespace_label!r} was accepted")
 
     def test_max_length_label_valid(self):
         """Test that label at max length (255 chars) is valid"""
@@ -74,6 +68,11 @@ class TestTreeNodeCreateRequest:
         request = TreeNodeCreateRequest(label=max_label)
         assert len(request.label) == 255
 
+    def test_max_length_checked_after_trimming(self):
+        """Test that surrounding whitespace does not count towards max length"""
+        request = TreeNodeCreateRequest(label=f"  {'a' * 255}  ")
+        assert len(request.label) == 255
+
     def test_long_label_raises_error(self):
         """Test that label exceeding max length raises validation error"""
         long_label = "a" * 256
@@ -81,18 +80,18 @@ class TestTreeNodeCreateRequest:
             TreeNodeCreateRequest(label=long_label)
         assert "String should have at most 255 characters" in str(exc_info.value)
 
-    @pytest.mark.parametrize("invalid_parent_id", [0, -1, -100])
-    def test_invalid_parent_id_raises_error(self, invalid_parent_id):
+    def test_invalid_parent_id_raises_error(self):
         """Test that invalid parent IDs raise validation error"""
-        with pytest.raises(ValidationError) as exc_info:
-            TreeNodeCreateRequest(label="Test", parentId=invalid_parent_id)
-        assert "Parent ID must be a positive integer" in str(exc_info.value)
+        for invalid_parent_id in (0, -1, -100):
+            with pytest.raises(ValidationError, match="greater than 0"):
+                TreeNodeCreateRequest(label="Test", parentId=invalid_parent_id)
+                pytest.fail(f"Parent ID {invalid_parent_id} was accepted")
 
-    @pytest.mark.parametrize("valid_parent_id", [1, 100, 999999])
-    def test_valid_parent_ids(self, valid_parent_id):
+    def test_valid_parent_ids(self):
         """Test that valid parent IDs are accepted"""
-        request = TreeNodeCreateRequest(label="Test", parentId=valid_parent_id)
-        assert request.parentId == valid_parent_id
+        for valid_parent_id in (1, 100, 999999):
+            request = TreeNodeCreateRequest(label="Test", parentId=valid_parent_id)
+            assert request.parentId == valid_parent_id, valid_parent_id
 
     def test_invalid_parent_id_type_raises_error(self):
         """Test that non-integer parent ID raises validation error"""
@@ -107,6 +106,12 @@ class TestTreeNodeCreateRequest:
         request = TreeNodeCreateRequest(label=special_label)
         assert request.label == special_label
 
+    def test_request_is_frozen(self):
+        """Test that validated request fields cannot be reassigned"""
+        request = TreeNodeCreateRequest(label="Test")
+        with pytest.raises(ValidationError):
+            request.label = "   "
+
 
 class TestTreeNodeResponse:
     """Test cases for TreeNodeResponse serializer"""
@@ -122,12 +127,24 @@ class TestTreeNodeResponse:
         """Test that from_attributes is properly configured"""
         assert TreeNodeResponse.model_config["from_attributes"] is True
 
+    def test_response_is_frozen(self):
+        """Test that response fields cannot be reassigned"""
+        response = TreeNodeResponse(id=1, label="Test")
+        with pytest.raises(ValidationError):
+            response.label = "Changed"
+
     def test_model_dump_includes_all_fields(self):
         """Test that model dump includes all expected fields"""
         response = TreeNodeResponse(id=1, label="Test")
         dumped = response.model_dump()
         assert dumped == {"id": 1, "label": "Test", "parentId": None}
 
+    def test_constructed_response_dumps_like_validated(self):
+        """Test that skipping validation for trusted data yields the same dump"""
+        constructed = TreeNodeResponse.model_construct(id=2, label="Test", parentId=1)
+        validated = TreeNodeResponse(id=2, label="Test", parentId=1)
+        assert constructed.model_dump() == validated.model_dump()
+
     def test_response_from_mock_model_instance(self):
         """Test creating response from mock model instance"""
 
@@ -160,7 +177,7 @@ class TestTreeNodeResponse:
         """Test that negative and zero IDs raise validation errors"""
         with pytest.raises(ValidationError) as exc_info:
             TreeNodeResponse(id=invalid_id, label="Test")
-        assert "ID must be a positive integer" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
     def test_positive_id_valid(self):
         """Test that positive IDs are valid"""
@@ -228,6 +245,13 @@ class TestTreeNodeWithChildren:
         node = TreeNodeWithChildren(**data)
         assert isinstance(node.children[0], TreeNodeWithChildren)
 
+    def test_default_children_not_shared(self):
+        """Test that leaf nodes do not share the default children list"""
+        first = TreeNodeWithChildren(id=1, label="First")
+        second = TreeNodeWithChildren(id=2, label="Second")
+        first.children.append(TreeNodeWithChildren(id=3, label="Child"))
+        assert second.children == []
+
     def test_empty_children_list_explicit(self):
         """Test explicitly setting children to empty list"""
         data = {"id": 1, "label": "Node", "children": []}
@@ -270,7 +294,7 @@ class TestTreeNodeWithChildren:
         """Test that negative and zero IDs raise validation errors"""
         with pytest.raises(ValidationError) as exc_info:
             TreeNodeWithChildren(id=invalid_id, label="Test")
-        assert "ID must be a positive integer" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
     def test_invalid_child_id_raises_error(self):
         """Test that invalid child ID raises validation error"""
@@ -278,7 +302,7 @@ class TestTreeNodeWithChildren:
             TreeNodeWithChildren(
                 id=1, label="Parent", children=[{"id": -1, "label": "Invalid Child"}]
             )
-        assert "ID must be a positive integer" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
 
 class TestErrorResponse:
@@ -298,6 +322,12 @@ class TestErrorResponse:
         assert error.error == "Validation failed"
         assert error.details == "Label cannot be empty"
 
+    def test_error_with_structured_details(self):
+        """Test error response with a list of validation errors as details"""
+        errors = [{"type": "missing", "loc": ["label"], "msg": "Field required"}]
+        error = ErrorResponse(error="Validation failed", details=errors)
+        assert error.details == errors
+
     def test_error_with_empty_details(self):
         """Test error response with empty details string"""
         error = ErrorResponse(error="Error", details="")
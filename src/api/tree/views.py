@@ -13,7 +13,8 @@ from adrf.views import APIView
 from drf_spectacular.utils import extend_schema
 from rest_framework.response import Response
 from rest_framework import status
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
 from asgiref.sync import sync_to_async
 from .models import TreeNode
 from .serializers import (
@@ -24,10 +25,155 @@ from .serializers import (
     ErrorResponse,
 )
 from pydantic import ValidationError
+import logging
 import structlog
 
 
-logger = structlog.get_logger(__name__)
+# Bound once at import, after the settings have configured structlog, so that
+# every call goes straight to the level-filtering logger instead of through
+# the lazy proxy get_logger() returns
+logger = structlog.get_logger(__name__).bind()
+
+
+def _validate_request_body(request, model):
+    """
+    Validate a request body against a Pydantic model.
+
+    JSON bodies are parsed and validated by pydantic-core in a single pass
+    over the raw bytes, without building an intermediate dict. Other media
+    types go through DRF's parsers first.
+
+    Args:
+        request: DRF request object
+        model: Pydantic model class to validate the body against
+
+    Returns:
+        BaseModel: Validated model instance
+
+    Raises:
+        ValidationError: If the body is not valid JSON or fails validation
+        UnsupportedMediaType: If no parser accepts the request's media type
+    """
+    if request.content_type.partition(";")[0].strip() == "application/json":
+        return model.model_validate_json(request.body)
+    return model.model_validate(request.data)
+
+
+def _bad_request(error, details=None):
+    """
+    Build a 400 response in the ErrorResponse format.
+
+    The body is a plain dict with ErrorResponse's fields: the values are
+    strings built by the view itself, so running them through the model
+    would only repeat work on every rejected request.
+
+    Args:
+        error (str): Main error message
+        details (str | list): Optional additional context or validation errors
+
+    Returns:
+        Response: HTTP 400 response with the error body
+    """
+    return Response(
+        {"error": error, "details": details}, status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+@sync_to_async
+def _fetch_forest_json():
+    """
+    Database operation wrapper for reading every tree.
+
+    Returns:
+        bytes: JSON array of all trees
+    """
+    return TreeNode.cached_forest_json()
+
+
+@sync_to_async
+def _create_tree_node(validated_data):
+    """
+    Database operation wrapper for creating tree nodes.
+
+    Uses atomic transactions to ensure data consistency.
+    The node is inserted without looking its parent up first: the database
+    rejects a missing parent on the INSERT itself.
+
+    Args:
+        validated_data (TreeNodeCreateRequest): Validated creation request
+
+    Returns:
+        TreeNode: The newly created tree node instance
+
+    Raises:
+        ValueError: If parent node doesn't exist
+    """
+    try:
+        with transaction.atomic():
+            new_node = TreeNode.objects.create(
+                label=validated_data.label, parent_id=validated_data.parentId
+            )
+    except IntegrityError:
+        raise ValueError("Parent node does not exist")
+
+    logger.info(
+        "Tree node created successfully",
+        node_id=new_node.id,
+        label=new_node.label,
+        parent_id=new_node.parent_id,
+    )
+
+    return new_node
+
+
+@sync_to_async
+def _clone_tree_node(validated_data):
+    """
+    Database operation wrapper for cloning tree nodes.
+
+    Uses atomic transactions to ensure data consistency.
+    Validates parent and target node existence before cloning.
+
+    Args:
+        validated_data (TreeNodeCloneRequest): Validated clone request
+
+    Returns:
+        TreeNode: The newly cloned tree node instance
+
+    Raises:
+        ValueError: If parent or target node doesn't exist
+    """
+    with transaction.atomic():
+        # Load parent and target nodes with a single query
+        nodes = TreeNode.objects.in_bulk(
+            [validated_data.parent_id, validated_data.target_id]
+        )
+
+        # Validate parent node existence
+        parent = nodes.get(validated_data.parent_id)
+        if parent is None:
+            raise ValueError("Parent node does not exist")
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Parent node found", parent_id=validated_data.parent_id)
+
+        # Validate target node existence
+        target = nodes.get(validated_data.target_id)
+        if target is None:
+            raise ValueError("Target node does not exist")
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Target node found", target_id=validated_data.target_id)
+
+        # Clone the target node and its descendants
+        cloned_node = target.clone_subtree(parent=parent)
+
+        logger.info(
+            "Tree node cloned successfully",
+            cloned_node_id=cloned_node.id,
+            original_node_id=target.id,
+            new_parent_id=parent.id,
+        )
+
+        return cloned_node
 
 
 class TreeAPIView(APIView):
@@ -86,23 +232,21 @@ class TreeAPIView(APIView):
         """
         logger.info("Fetching all tree structures")
 
-        # Query optimization: Use prefetch_related to minimize database queries
-        # when accessing children relationships
-        root_nodes = await sync_to_async(list)(
-            TreeNode.objects.filter(parent__isnull=True).prefetch_related("children")
-        )
-
-        # Convert Django model instances to dictionary format for JSON serialization
-        tree_data = await sync_to_async(
-            lambda: [node.to_dict_with_children() for node in root_nodes]
-        )()
+        # An unchanged forest is served from cache, otherwise it is fetched with
+        # one query. Trees arrive already JSON-encoded, so the body is returned
+        # directly instead of going through DRF's renderer.
+        forest_json = await _fetch_forest_json()
 
         logger.info(
             "Successfully retrieved tree data",
-            tree_count=len(tree_data),
+            response_bytes=len(forest_json),
         )
 
-        return Response(tree_data, status=status.HTTP_200_OK)
+        return HttpResponse(
+            forest_json,
+            content_type="application/json",
+            status=status.HTTP_200_OK,
+        )
 
     @extend_schema(
         methods=["post"],
@@ -121,7 +265,7 @@ class TreeAPIView(APIView):
         Create a new tree node with optional parent relationship.
 
         Validates input data and creates a new tree node. If a parent ID is provided,
-        validates that the parent exists before creating the relationship.
+        the database rejects it when the parent does not exist.
 
         Args:
             request: HTTP request object containing node data
@@ -146,81 +290,47 @@ class TreeAPIView(APIView):
                 "parentId": 456  # or null for root nodes
             }
         """
-        logger.info("Creating new tree node", request_data=request.data)
+        logger.info("Creating new tree node")
 
         try:
             # Validate request data using Pydantic model
             # This ensures type safety and business rule validation
-            validated_data = TreeNodeCreateRequest.model_validate(request.data)
-            logger.debug(
-                "Request data validated successfully",
-                label=validated_data.label,
-                parent_id=validated_data.parentId,
-            )
+            validated_data = _validate_request_body(request, TreeNodeCreateRequest)
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Request data validated successfully",
+                    label=validated_data.label,
+                    parent_id=validated_data.parentId,
+                )
         except ValidationError as e:
-            logger.warning("Validation failed", error=str(e), request_data=request.data)
-            error_response = ErrorResponse(error="Validation failed", details=str(e))
-            return Response(
-                error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST
+            errors = e.errors(include_url=False, include_input=False)
+            logger.warning(
+                "Validation failed",
+                errors=errors,
+                body_bytes=len(request.body),
             )
-
-        @sync_to_async
-        def create_tree_node():
-            """
-            Database operation wrapper for creating tree nodes.
-
-            Uses atomic transactions to ensure data consistency.
-            Validates parent existence before creating relationships.
-
-            Returns:
-                TreeNode: The newly created tree node instance
-
-            Raises:
-                ValueError: If parent node doesn't exist
-            """
-            with transaction.atomic():
-                parent = None
-
-                # Validate parent node existence if parent ID provided
-                if validated_data.parentId:
-                    try:
-                        parent = TreeNode.objects.get(id=validated_data.parentId)
-                        logger.debug(
-                            "Parent node found", parent_id=validated_data.parentId
-                        )
-                    except TreeNode.DoesNotExist:
-                        raise ValueError("Parent node does not exist")
-
-                # Create and save new tree node
-                new_node = TreeNode(label=validated_data.label, parent=parent)
-                new_node.save()
-
-                logger.info(
-                    "Tree node created successfully",
-                    node_id=new_node.id,
-                    label=new_node.label,
-                    parent_id=new_node.parent.id if new_node.parent else None,
-                )
-
-                return new_node
+            return _bad_request("Validation failed", details=errors)
 
         try:
-            new_node = await create_tree_node()
+            new_node = await _create_tree_node(validated_data)
         except ValueError as e:
             logger.warning("Node creation failed", error=str(e))
-            error_response = ErrorResponse(error=str(e))
-            return Response(
-                error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST
-            )
+            return _bad_request(str(e))
 
-        # Serialize response using Pydantic model for consistency
-        response_data = TreeNodeResponse(
+        # Serialize response using Pydantic model for consistency; the values
+        # come straight from the saved row, so validation is skipped
+        response_data = TreeNodeResponse.model_construct(
             id=new_node.id,
             label=new_node.label,
-            parentId=new_node.parent.id if new_node.parent else None,
+            parentId=new_node.parent_id,
         )
 
-        return Response(response_data.model_dump(), status=status.HTTP_201_CREATED)
+        # Encoded by pydantic-core directly, skipping DRF's renderer
+        return HttpResponse(
+            response_data.model_dump_json(),
+            content_type="application/json",
+            status=status.HTTP_201_CREATED,
+        )
 
 
 """input:{
@@ -269,75 +379,30 @@ class TreeCloneAPIView(APIView):
             ValidationError: If input data is invalid
             ValueError: If parent or target node doesn't exist
         """
-        logger.info("Cloning tree node", request_data=request.data)
+        logger.info("Cloning tree node")
 
         try:
             # Validate request data using Pydantic model
-            validated_data = TreeNodeCloneRequest.model_validate(request.data)
-            logger.debug(
-                "Clone request data validated successfully",
-                parent_id=validated_data.parent_id,
-                target_id=validated_data.target_id,
-            )
+            validated_data = _validate_request_body(request, TreeNodeCloneRequest)
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Clone request data validated successfully",
+                    parent_id=validated_data.parent_id,
+                    target_id=validated_data.target_id,
+                )
         except ValidationError as e:
-            logger.warning("Validation failed", error=str(e), request_data=request.data)
-            error_response = ErrorResponse(error="Validation failed", details=str(e))
-            return Response(
-                error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST
+            errors = e.errors(include_url=False, include_input=False)
+            logger.warning(
+                "Validation failed",
+                errors=errors,
+                body_bytes=len(request.body),
             )
-
-        @sync_to_async
-        def clone_tree_node():
-            """
-            Database operation wrapper for cloning tree nodes.
-
-            Uses atomic transactions to ensure data consistency.
-            Validates parent and target node existence before cloning.
-
-            Returns:
-                TreeNode: The newly cloned tree node instance
-
-            Raises:
-                ValueError: If parent or target node doesn't exist
-            """
-            with transaction.atomic():
-                # Validate parent node existence
-                try:
-                    parent = TreeNode.objects.get(id=validated_data.parent_id)
-                    logger.debug(
-                        "Parent node found", parent_id=validated_data.parent_id
-                    )
-                except TreeNode.DoesNotExist:
-                    raise ValueError("Parent node does not exist")
-
-                # Validate target node existence
-                try:
-                    target = TreeNode.objects.get(id=validated_data.target_id)
-                    logger.debug(
-                        "Target node found", target_id=validated_data.target_id
-                    )
-                except TreeNode.DoesNotExist:
-                    raise ValueError("Target node does not exist")
-
-                # Clone the target node and its descendants
-                cloned_node = target.clone_subtree(parent=parent)
-
-                logger.info(
-                    "Tree node cloned successfully",
-                    cloned_node_id=cloned_node.id,
-                    original_node_id=target.id,
-                    new_parent_id=parent.id,
-                )
-
-                return cloned_node
+            return _bad_request("Validation failed", details=errors)
 
         try:
-            await clone_tree_node()
+            await _clone_tree_node(validated_data)
         except ValueError as e:
             logger.warning("Node cloning failed", error=str(e))
-            error_response = ErrorResponse(error=str(e))
-            return Response(
-                error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST
-            )
+            return _bad_request(str(e))
 
         return Response(status=status.HTTP_201_CREATED)
@@ -10,7 +10,13 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import reverse
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "theary.settings")
 
 application = get_asgi_application()
+
+# Import the URLconf and the views behind it, and build the resolver's lookup
+# tables, while the worker starts rather than inside the first request it
+# serves
+reverse("tree-api")
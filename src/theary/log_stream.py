@@ -0,0 +1,134 @@
+"""
+Log output for the Theary coding challenge project.
+
+Keeps writing log lines out of the request path: structlog events are
+batched into large writes to stdout, and standard library records are
+formatted and written by a background thread.
+
+Classes:
+    BufferedLogStream: Binary stdout stream that coalesces log writes
+    DeferredFormatQueueHandler: Queue handler that leaves formatting to its listener
+
+Functions:
+    add_timestamp: structlog processor stamping events with the current UTC time
+"""
+
+import atexit
+import copy
+import io
+import logging
+import signal
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+
+
+def add_timestamp(logger, method_name: str, event_dict: dict) -> dict:
+    """
+    Add the current UTC time to a structlog event under "timestamp".
+
+    The value is left as a datetime for the renderer to format: orjson
+    writes it as ISO 8601 in native code, where TimeStamper(fmt="iso")
+    would build the string in Python for every event.
+    """
+    event_dict["timestamp"] = datetime.now(timezone.utc)
+    return event_dict
+
+
+class BufferedLogStream(io.BufferedWriter):
+    """
+    Binary stream to stdout that batches log events into large writes.
+
+    Per-event flush() calls are ignored. Buffered events are written out
+    when the buffer fills up, by a background thread every flush_interval
+    seconds so that a quiet process still shows its last lines, when the
+    process exits, and on SIGTERM once flush_on_sigterm() is called.
+
+    Args:
+        buffer_size (int): Bytes held in memory before they are written out
+        flush_interval (float): Longest time, in seconds, an event is held
+    """
+
+    def __init__(self, buffer_size: int = 64 * 1024, flush_interval: float = 1.0):
+        super().__init__(
+            io.FileIO(sys.stdout.fileno(), "wb", closefd=False), buffer_size
+        )
+        self._flush_interval = flush_interval
+        self._flush_lock = threading.RLock()
+        self._closing = threading.Event()
+        threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True
+        ).start()
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        """Leave buffered events for the next periodic or final flush"""
+
+    def force_flush(self) -> None:
+        """Write all buffered events out now"""
+        with self._flush_lock:
+            if not self.closed:
+                super().flush()
+
+    def close(self) -> None:
+        """Write out buffered events and stop the background thread"""
+        with self._flush_lock:
+            self._closing.set()
+            self.force_flush()
+            super().close()
+
+    def flush_on_sigterm(self) -> None:
+        """
+        Write buffered events out when the process receives SIGTERM.
+
+        The handler that was installed before runs afterwards; if that was
+        the default action, the signal is raised again so the process still
+        terminates as it would have. Signal handlers can only be installed
+        from the main thread, so this does nothing elsewhere.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def handle_sigterm(signum, frame):
+            try:
+                self.force_flush()
+            except RuntimeError:
+                pass  # The signal interrupted a write to this stream
+            if callable(previous):
+                previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                signal.signal(signum, signal.SIG_DFL)
+                signal.raise_signal(signum)
+
+        signal.signal(signal.SIGTERM, handle_sigterm)
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed"""
+        while not self._closing.wait(self._flush_interval):
+            self.force_flush()
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    Queue handler whose records are formatted by the listener's handlers.
+
+    The logging call only enqueues the record; the QueueListener that
+    dictConfig attaches as .listener runs the formatter and writes the
+    result on its background thread. The listener is started from
+    ApiConfig.ready().
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments now and leave the rest to the formatter.
+
+        The arguments may change once the call returns, so the message is
+        built up front. The queue never leaves the process, so exception
+        information is passed on as-is for the formatter to render.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
@@ -8,23 +8,35 @@ Environment Variables:
     SECRET_KEY: Django secret key for cryptographic signing
     DEBUG: Enable/disable debug mode (default: True)
     ALLOWED_HOSTS: Comma-separated list of allowed hostnames
+    ENABLE_ADMIN: Serve the Django admin under /admin/ (default: False)
     DB_NAME: PostgreSQL database name
     DB_USER: PostgreSQL database user
     DB_PASSWORD: PostgreSQL database password
     DB_HOST: PostgreSQL database host
     DB_PORT: PostgreSQL database port
+    DB_POOL_MIN: Connections kept open by the pool (default: 4)
+    DB_POOL_MAX: Upper bound on pooled connections (default: 20)
+    DB_CONN_MAX_AGE: Seconds a connection is kept open when psycopg_pool is
+        not installed (default: 60)
+    LOG_LEVEL: Level for Django and third-party logs (default: INFO in debug
+        mode, WARNING otherwise)
+    APP_LOG_LEVEL: Level for application logs (default: DEBUG in debug mode,
+        INFO otherwise)
 
 Key Features:
-    - PostgreSQL database configuration
+    - PostgreSQL database configuration with connection pooling
     - Structured logging with structlog
     - DRF Spectacular for API documentation
     - Async support with ADRF
 """
 
+import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+import orjson
 import structlog
+from .log_stream import add_timestamp
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -43,19 +55,22 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv("DEBUG", "True").lower() in ("true", "1", "yes")
 
-ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+# Whitespace around the commas is allowed, e.g. "localhost, example.com"
+ALLOWED_HOSTS = tuple(
+    host.strip()
+    for host in os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+)
 
 APPEND_SLASH = True
 
 # Application definition
+# The Django admin is opt-in: the API uses no sessions, users or messages, so
+# their apps and middleware are only loaded along with it
+ENABLE_ADMIN = os.getenv("ENABLE_ADMIN", "False").lower() in ("true", "1", "yes")
+
 INSTALLED_APPS = [
-    # Django core applications
-    "django.contrib.admin",
-    "django.contrib.auth",
-    "django.contrib.contenttypes",
-    "django.contrib.sessions",
-    "django.contrib.messages",
-    "django.contrib.staticfiles",
+    # Django applications
+    "django.contrib.postgres",  # ArrayField and GinIndex on TreeNode
     # Third-party applications
     "drf_spectacular",  # API documentation
     "adrf",  # Async Django REST Framework
@@ -67,6 +82,9 @@ INSTALLED_APPS = [
 REST_FRAMEWORK = {
     # Use drf-spectacular for OpenAPI schema generation
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # The API is public, so requests are not authenticated at all
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "UNAUTHENTICATED_USER": None,
 }
 
 # API documentation configuration
@@ -79,12 +97,7 @@ SPECTACULAR_SETTINGS = {
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "theary.urls"
@@ -97,13 +110,38 @@ TEMPLATES = [
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
-                "django.contrib.auth.context_processors.auth",
-                "django.contrib.messages.context_processors.messages",
             ],
         },
     },
 ]
 
+# Static files are only served by runserver in debug mode, or collected for
+# the admin; the ASGI server serves none and Swagger UI loads from a CDN
+if DEBUG or ENABLE_ADMIN:
+    INSTALLED_APPS.insert(0, "django.contrib.staticfiles")
+
+if ENABLE_ADMIN:
+    INSTALLED_APPS[:0] = [
+        "django.contrib.admin",
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "django.contrib.sessions",
+        "django.contrib.messages",
+    ]
+    MIDDLEWARE = [
+        "django.middleware.security.SecurityMiddleware",
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.common.CommonMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    ]
+    TEMPLATES[0]["OPTIONS"]["context_processors"] += [
+        "django.contrib.auth.context_processors.auth",
+        "django.contrib.messages.context_processors.messages",
+    ]
+
 ASGI_APPLICATION = "theary.asgi.application"
 
 
@@ -118,9 +156,32 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", ""),
         "HOST": os.getenv("DB_HOST", ""),
         "PORT": os.getenv("DB_PORT", ""),
+        # A connection left open is checked before it is handed out, so a
+        # dropped one is replaced instead of failing the request. With the
+        # pool below, Django applies this as the pool's check callback
+        # (ConnectionPool.check_connection, run on every checkout), which is
+        # why the check is not also given in OPTIONS["pool"]
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
     }
 }
 
+# Keep a pool of open connections (psycopg 3) rather than opening a new one,
+# with its TCP and authentication handshake, on every request. The pool owns
+# connection lifetimes; without psycopg_pool each worker instead keeps its
+# connection open across requests for DB_CONN_MAX_AGE seconds.
+try:
+    import psycopg_pool  # noqa: F401
+except ImportError:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN", "4")),
+        "max_size": int(os.getenv("DB_POOL_MAX", "20")),
+        "timeout": 10,
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -165,64 +226,86 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Structured logging configuration using structlog
-# Provides consistent, structured log output with JSON formatting in production
+# Provides consistent, structured log output with JSON formatting in production.
+# Only Django's own logs and third-party stdlib loggers go through LOGGING;
+# application loggers are configured with structlog below. Outside debug mode
+# Django's per-request INFO records are not emitted at all.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO" if DEBUG else "WARNING").upper()
+APP_LOG_LEVEL = os.getenv("APP_LOG_LEVEL", "DEBUG" if DEBUG else "INFO").upper()
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
         "json_formatter": {
             "()": structlog.stdlib.ProcessorFormatter,
-            # Use console renderer in debug mode, JSON in production
+            # Use console renderer in debug mode, JSON in production. The
+            # formatter must return text, so orjson's output is decoded
             "processor": structlog.dev.ConsoleRenderer()
             if DEBUG
-            else structlog.processors.JSONRenderer(),
+            else structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kwargs: orjson.dumps(obj, **kwargs).decode()
+            ),
         },
     },
     "handlers": {
-        "default": {
-            "level": "INFO",
+        "stream": {
             "class": "logging.StreamHandler",
             "formatter": "json_formatter",
         },
+        # Records are handed to a background thread that formats them and
+        # writes them through "stream"; the listener is started by
+        # ApiConfig.ready()
+        "default": {
+            "level": LOG_LEVEL,
+            "class": "theary.log_stream.DeferredFormatQueueHandler",
+            "queue": {"()": "queue.SimpleQueue"},
+            "handlers": ["stream"],
+        },
     },
     "loggers": {
         # Root logger configuration
         "": {
             "handlers": ["default"],
-            "level": "INFO",
+            "level": LOG_LEVEL,
             "propagate": True,
         },
         # Django framework logs
         "django": {
             "handlers": ["default"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        # Application-specific logs with debug level
-        "api": {
-            "handlers": ["default"],
-            "level": "DEBUG",
+            "level": LOG_LEVEL,
             "propagate": False,
         },
     },
 }
 
 # Structlog processor configuration
-# Configures the structured logging pipeline for consistent log formatting
+# Application loggers write rendered events straight to stdout instead of
+# handing them to the standard library as LogRecords, so no record, formatter
+# or handler lock is involved. In production events are encoded by orjson and
+# written as bytes without an intermediate str, batched into large writes to
+# stdout rather than one system call per event. The processor chain is kept
+# to what every event needs: events carry keyword values only, so there are
+# no positional arguments to merge and no bytes to decode.
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        structlog.processors.add_log_level,
+        add_timestamp,
         structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        structlog.dev.ConsoleRenderer()
+        if DEBUG
+        else structlog.processors.JSONRenderer(
+            serializer=orjson.dumps, option=orjson.OPT_UTC_Z
+        ),
     ],
     context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    # Outside debug mode ApiConfig.ready() switches to a BufferedLogStream,
+    # so importing the settings starts no threads or signal handlers
+    logger_factory=structlog.WriteLoggerFactory()
+    if DEBUG
+    else structlog.BytesLoggerFactory(),
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelNamesMapping()[APP_LOG_LEVEL]
+    ),
     cache_logger_on_first_use=True,
 )
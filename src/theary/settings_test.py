@@ -0,0 +1,17 @@
+"""
+Django settings for running the test suite.
+
+Extends the project settings with options that are only safe for
+throwaway test databases. The tests still run against PostgreSQL, as
+the tree relies on array columns, GIN indexes, triggers and database
+functions.
+
+Key Features:
+    - Commits return without waiting for the WAL flush (synchronous_commit=off)
+"""
+
+from .settings import *  # noqa: F403
+from .settings import DATABASES
+
+# Losing the last few commits on a crash is harmless for a test database
+DATABASES["default"]["OPTIONS"]["options"] = "-c synchronous_commit=off"
@@ -5,19 +5,17 @@ This module defines the root URL patterns that route requests to appropriate
 applications and API documentation endpoints.
 
 URL Patterns:
-    - admin/: Django admin interface
+    - admin/: Django admin interface, when ENABLE_ADMIN is set
     - api/tree/: Tree management API endpoints
     - api/schema/: OpenAPI schema endpoint
     - api/swagger: Interactive API documentation (Swagger UI)
 """
 
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
 urlpatterns = [
-    # Django admin interface
-    path("admin/", admin.site.urls),
     # Tree API endpoints
     path("api/tree/", include("api.tree.urls")),
     # API documentation endpoints
@@ -28,3 +26,9 @@ urlpatterns = [
         name="swagger-ui",
     ),
 ]
+
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    # Django admin interface
+    urlpatterns.insert(0, path("admin/", admin.site.urls))